@@ -173,6 +173,17 @@ class MentorRegistrationForm(BaseFormMixin, UserCreationForm):
             raise forms.ValidationError(_('An account with this email already exists.'))
         return email
 
+    def profile_defaults(self):
+        """MentorProfile field values collected by this form"""
+        mentor_data = {
+            'expertise': self.cleaned_data.get('expertise', ''),
+            'experience_years': self.cleaned_data.get('experience_years', 0),
+        }
+        # Add city if the field exists in MentorProfile
+        if self.cleaned_data.get('city'):
+            mentor_data['city'] = self.cleaned_data.get('city', '')
+        return mentor_data
+
     def save(self, commit=True):
         user = super().save(commit=False)
         user.role = User.Role.MENTOR
@@ -181,17 +192,9 @@ class MentorRegistrationForm(BaseFormMixin, UserCreationForm):
             # Save expertise, experience_years, and city to MentorProfile
             try:
                 from profiles.models import MentorProfile
-                mentor_data = {
-                    'expertise': self.cleaned_data.get('expertise', ''),
-                    'experience_years': self.cleaned_data.get('experience_years', 0),
-                }
-                # Add city if the field exists in MentorProfile
-                if self.cleaned_data.get('city'):
-                    mentor_data['city'] = self.cleaned_data.get('city', '')
-
                 MentorProfile.objects.get_or_create(
                     user=user,
-                    defaults=mentor_data
+                    defaults=self.profile_defaults()
                 )
             except Exception:
                 pass
@@ -62,6 +62,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'core.middleware.ThemeMiddleware',  # Custom theme middleware
+    'notifications.middleware.NotificationMiddleware',  # Flush queued notifications
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -103,6 +104,38 @@ CHANNEL_LAYERS = {
     },
 }
 
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+
+# Session/calendar caches are invalidated by bumping a per-mentor version key,
+# so every web process must share one cache. Set REDIS_URL whenever more than
+# one process serves requests; the local-memory fallback is for single-process
+# development only.
+REDIS_URL = os.getenv('REDIS_URL', '')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+    }
+
+# =============================================================================
+# CELERY CONFIGURATION (Background tasks)
+# =============================================================================
+
+# Without a broker, tasks run inline in the calling process
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', '')
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+CELERY_TASK_IGNORE_RESULT = True
+
 # =============================================================================
 # DATABASE CONFIGURATION
 # =============================================================================
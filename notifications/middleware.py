@@ -0,0 +1,45 @@
+"""
+Notifications Middleware
+Flush notifications queued with `notifications.services.notify`
+"""
+
+import logging
+
+from .tasks import create_notifications
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationMiddleware:
+    """
+    Hand all notifications queued during the request to a background task
+    that writes them in one bulk INSERT
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        pending = getattr(request, '_pending_notifs', None)
+        if pending:
+            rows = [
+                {
+                    'recipient_id': n.recipient_id,
+                    'sender_id': n.sender_id,
+                    'notification_type': n.notification_type,
+                    'title': n.title,
+                    'message': n.message,
+                    'link': n.link,
+                }
+                for n in pending
+            ]
+            try:
+                # Handed to a Celery worker when a broker is configured
+                create_notifications.delay(rows)
+            except Exception:
+                # Notifications are best effort and must never break the response
+                logger.exception('Failed to save %d queued notification(s)', len(pending))
+            request._pending_notifs = []
+
+        return response
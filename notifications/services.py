@@ -0,0 +1,31 @@
+"""
+Notifications Services
+Queue notifications during a request and write them in one batch
+"""
+
+from .models import Notification
+
+
+def notify(request, recipient, notification_type, message, **extra):
+    """
+    Queue a notification from the current user to `recipient`, which may
+    be a user or a user's primary key.
+
+    Once the view has returned, NotificationMiddleware hands the queued
+    rows to the `create_notifications` task, which writes them in one
+    bulk INSERT.
+    """
+    sender = request.user if request.user.is_authenticated else None
+    pending = getattr(request, '_pending_notifs', None)
+    if pending is None:
+        pending = request._pending_notifs = []
+    if isinstance(recipient, int):
+        extra['recipient_id'] = recipient
+    else:
+        extra['recipient'] = recipient
+    pending.append(Notification(
+        sender=sender,
+        notification_type=notification_type,
+        message=message,
+        **extra
+    ))
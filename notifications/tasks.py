@@ -0,0 +1,19 @@
+"""
+Notifications Tasks
+Background creation of notifications queued during a request
+"""
+
+from .models import Notification
+
+try:
+    from celery import shared_task
+except ImportError:  # Celery not installed: run tasks inline
+    def shared_task(func):
+        func.delay = func
+        return func
+
+
+@shared_task
+def create_notifications(rows):
+    """Bulk-insert notifications from a list of field dicts"""
+    Notification.objects.bulk_create([Notification(**row) for row in rows])
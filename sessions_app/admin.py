@@ -1,6 +1,29 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from .models import Availability, Session
+from .pagination import EstimatedCountPaginator
+
+
+# Choice labels resolved once instead of per row via get_*_display()
+_STATUS_LABELS = dict(Session.STATUS_CHOICES)
+_DAY_LABELS = dict(Availability.DAY_CHOICES)
+
+# Status values come from a fixed set, so render each badge once up front
+_STATUS_BADGE_COLORS = {
+    'pending': '#F59E0B',
+    'approved': '#3B82F6',
+    'rejected': '#EF4444',
+    'completed': '#10B981',
+    'cancelled': '#9CA3AF',
+}
+_STATUS_BADGE_TEMPLATE = (
+    '<span style="background-color: {}; color: white; padding: 4px 12px; '
+    'border-radius: 20px; font-weight: 600; font-size: 11px;">{}</span>'
+)
+_STATUS_BADGE_HTML = {
+    status: format_html(_STATUS_BADGE_TEMPLATE, _STATUS_BADGE_COLORS.get(status, '#9CA3AF'), label)
+    for status, label in _STATUS_LABELS.items()
+}
 
 
 @admin.register(Availability)
@@ -41,7 +64,7 @@ class AvailabilityAdmin(admin.ModelAdmin):
     def day_display(self, obj):
         # legacy support; if using start/end show date
         if obj.start:
-            return obj.start.strftime('%A')
+            return _DAY_LABELS[obj.start.weekday()]
         return ''
     day_display.short_description = 'Day'
 
@@ -71,9 +94,14 @@ class SessionAdmin(admin.ModelAdmin):
         'created_at_short',
     )
     list_filter = ('status', 'session_type', 'created_at')
+    list_select_related = ('mentor', 'student')
+    # Skip the second, unfiltered COUNT(*) and estimate the table size instead
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     search_fields = ('student__first_name', 'student__last_name', 'mentor__first_name', 'mentor__last_name', 'mentor_notes', 'student_notes', 'title')
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('-start',)
+    actions = ['mark_as_completed', 'mark_as_cancelled']
 
     fieldsets = (
         ('Session Information', {
@@ -127,21 +155,22 @@ class SessionAdmin(admin.ModelAdmin):
     session_time.admin_order_field = 'start'
 
     def status_badge(self, obj):
-        colors = {
-            'pending': '#F59E0B',
-            'approved': '#3B82F6',
-            'rejected': '#EF4444',
-            'completed': '#10B981',
-            'cancelled': '#9CA3AF',
-        }
-        color = colors.get(obj.status, '#9CA3AF')
-        label = obj.get_status_display()
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 4px 12px; border-radius: 20px; font-weight: 600; font-size: 11px;">{}</span>',
-            color, label
-        )
+        badge = _STATUS_BADGE_HTML.get(obj.status)
+        if badge is None:
+            badge = format_html(_STATUS_BADGE_TEMPLATE, '#9CA3AF', obj.status)
+        return badge
     status_badge.short_description = 'Status'
 
+    def mark_as_completed(self, request, queryset):
+        updated = queryset.complete()
+        self.message_user(request, f'{updated} session(s) marked as completed.')
+    mark_as_completed.short_description = 'Mark selected sessions as completed'
+
+    def mark_as_cancelled(self, request, queryset):
+        updated = queryset.cancel()
+        self.message_user(request, f'{updated} session(s) marked as cancelled.')
+    mark_as_cancelled.short_description = 'Mark selected sessions as cancelled'
+
     def created_at_short(self, obj):
         return obj.created_at.strftime('%b %d, %Y')
     created_at_short.short_description = 'Booked'
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class SessionsAppConfig(AppConfig):
     name = 'sessions_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,51 @@
+"""
+Per-mentor cache versioning for session and availability reads.
+
+Cached entries embed the mentor's current version in their key; bumping the
+version on any write makes every older entry unreachable at once. The bump
+only reaches processes that share the cache, so multi-process deployments
+need a shared backend (REDIS_URL in settings).
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def _version_key(mentor_id):
+    return f'sessions:mentor:{mentor_id}:ver'
+
+
+def mentor_cache_version(mentor_id):
+    # Seed with a timestamp so an evicted version never restarts at a value
+    # that older entries were stored under
+    return cache.get_or_set(_version_key(mentor_id), time.time_ns(), None)
+
+
+def mentor_cache_key(prefix, mentor_id, *parts):
+    """Build a cache key that is invalidated by `bump_mentor_cache`"""
+    version = mentor_cache_version(mentor_id)
+    return ':'.join(str(p) for p in (prefix, mentor_id, version, *parts))
+
+
+def _bump(mentor_ids):
+    for mentor_id in mentor_ids:
+        try:
+            cache.incr(_version_key(mentor_id))
+        except ValueError:
+            cache.set(_version_key(mentor_id), time.time_ns(), None)
+
+
+def bump_mentor_cache(*mentor_ids):
+    """
+    Invalidate cached reads for the given mentors once the current
+    transaction commits.
+
+    Bumping earlier would let a concurrent reader fill the new version's
+    keys with pre-write rows. Outside a transaction this runs immediately,
+    so call it after the write.
+    """
+    mentor_ids = {mentor_id for mentor_id in mentor_ids if mentor_id is not None}
+    if mentor_ids:
+        transaction.on_commit(lambda: _bump(mentor_ids))
@@ -4,22 +4,36 @@ Calendar utilities - ICS file generation for session export
 
 from django.http import HttpResponse
 from django.utils import timezone
-from datetime import timedelta
+from datetime import timedelta, timezone as dt_timezone
 import uuid
 
 
-def generate_ics_for_session(session, user_role='participant'):
-    """Generate ICS content for a single session"""
-    # Prefer `start`/`end` fields; fallback to legacy `scheduled_time`/`duration`
-    dt_start = getattr(session, 'start', None) or getattr(session, 'scheduled_time', None)
-    dt_end = getattr(session, 'end', None)
+# Static VCALENDAR wrapper; only the VEVENT body changes per session
+_ICS_HEADER = b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//MentorConnect//Sessions//EN\r\n'
+_ICS_FOOTER = b'END:VCALENDAR\r\n'
+
+# Namespace for event UIDs; re-exporting a session must yield the same UID
+# so calendar clients update the existing event instead of duplicating it
+_UID_NS = uuid.uuid5(uuid.NAMESPACE_URL, 'mentorconnect:sessions')
+
+
+def _ics_dt(dt):
+    """Format a datetime as an ICS UTC timestamp (YYYYMMDDTHHMMSSZ)"""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(dt_timezone.utc)
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z"
+
+
+def _format_vevent(session, dtstamp=None):
+    """Format the VEVENT block for a session.
+
+    `dtstamp` may be passed in so a bulk export stamps every event with the
+    same time instead of calling `timezone.now()` per session.
+    """
+    dt_start, dt_end = session.start, session.end
     if not dt_end and dt_start:
         # fallback duration 60 minutes
-        dt_end = dt_start + timedelta(minutes=getattr(session, 'duration', 60) or 60)
-
-    # Format for ICS (UTC)
-    def format_dt(dt):
-        return dt.strftime('%Y%m%dT%H%M%SZ')
+        dt_end = dt_start + timedelta(minutes=60)
 
     location = ''
     if session.session_type == 'physical' and session.address:
@@ -32,23 +46,26 @@ def generate_ics_for_session(session, user_role='participant'):
         desc = f"In-Person Session\n{location}\n\n{desc}".strip()
     elif session.meeting_link:
         desc = f"Join: {session.meeting_link}\n\n{desc}".strip()
+    desc = desc.replace('\n', '\\n')
+    uid = uuid.uuid5(_UID_NS, str(session.pk)) if session.pk is not None else uuid.uuid4()
+
+    return (
+        "BEGIN:VEVENT\r\n"
+        f"UID:{uid}@mentorconnect\r\n"
+        f"DTSTAMP:{_ics_dt(dtstamp or timezone.now())}\r\n"
+        f"DTSTART:{_ics_dt(dt_start)}\r\n"
+        f"DTEND:{_ics_dt(dt_end)}\r\n"
+        f"SUMMARY:{session.title}\r\n"
+        f"DESCRIPTION:{desc}\r\n"
+        f"LOCATION:{location}\r\n"
+        "STATUS:CONFIRMED\r\n"
+        "END:VEVENT\r\n"
+    )
+
 
-    ics = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//MentorConnect//Sessions//EN
-BEGIN:VEVENT
-UID:{uuid.uuid4()}@mentorconnect
-DTSTAMP:{format_dt(timezone.now())}
-DTSTART:{format_dt(dt_start)}
-DTEND:{format_dt(dt_end)}
-SUMMARY:{session.title}
-DESCRIPTION:{desc.replace(chr(10), '\\n')}
-LOCATION:{location}
-STATUS:CONFIRMED
-END:VEVENT
-END:VCALENDAR"""
-
-    return ics
+def generate_ics_for_session(session, user_role='participant', dtstamp=None):
+    """Generate ICS content (bytes) for a single session"""
+    return _ICS_HEADER + _format_vevent(session, dtstamp).encode() + _ICS_FOOTER
 
 
 def session_ics_response(session, filename='session.ics'):
@@ -58,7 +58,7 @@ class SessionRequestForm(forms.ModelForm):
 
 
 class SessionCreateForm(forms.ModelForm):
-    student = forms.ModelChoiceField(queryset=User.objects.all(), required=True, label='Student')
+    student = forms.ModelChoiceField(queryset=User.objects.none(), required=True, label='Student')
 
     class Meta:
         model = Session
@@ -72,6 +72,13 @@ class SessionCreateForm(forms.ModelForm):
             'address': forms.Textarea(attrs={'class': 'form-textarea', 'rows': 2}),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Only active students are valid choices; load just what the <select> renders
+        self.fields['student'].queryset = User.objects.filter(
+            is_active=True, role=User.Role.STUDENT
+        ).only('id', 'first_name', 'last_name', 'email').order_by('last_name', 'first_name')
+
     def clean(self):
         cleaned = super().clean()
         start = cleaned.get('start')
@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-16 16:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessions_app', '0009_alter_session_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='availability',
+            index=models.Index(fields=['mentor', 'start'], name='sessions_ap_mentor__af206d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='availability',
+            index=models.Index(fields=['mentor', 'is_active', 'is_booked'], name='sessions_ap_mentor__04982f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentor', 'start'], name='sessions_ap_mentor__ec7ad9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['student', 'start'], name='sessions_ap_student_b20abb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['status', 'start'], name='sessions_ap_status_77810d_idx'),
+        ),
+    ]
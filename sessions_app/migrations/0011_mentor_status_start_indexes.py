@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-16 16:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessions_app', '0010_session_availability_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='availability',
+            index=models.Index(fields=['mentor', 'is_active', 'start'], name='sessions_ap_mentor__d1100b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['mentor', 'status', 'start'], name='sessions_ap_mentor__ab87a9_idx'),
+        ),
+    ]
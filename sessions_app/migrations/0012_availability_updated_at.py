@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-16 16:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sessions_app', '0011_mentor_status_start_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='availability',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
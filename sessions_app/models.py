@@ -3,12 +3,23 @@ Sessions App Models
 Availability, booking, and session management
 """
 
-from django.db import models
+from datetime import timedelta
+
+from django.db import models, transaction
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+from .caching import bump_mentor_cache
+
+
+class AvailabilityQuerySet(models.QuerySet):
+    def overlapping(self, mentor, start, end):
+        """Active slots of `mentor` that overlap the [start, end) range"""
+        return self.filter(mentor=mentor, is_active=True, start__lt=end, end__gt=start)
 
 
 class Availability(models.Model):
@@ -30,7 +41,7 @@ class Availability(models.Model):
         on_delete=models.CASCADE,
         related_name='availabilities'
     )
-    # New datetime range support (optional alongside legacy day/time fields)
+    # Datetime range of the slot
     start = models.DateTimeField(null=True, blank=True, help_text='Start datetime of availability')
     end = models.DateTimeField(null=True, blank=True, help_text='End datetime of availability')
 
@@ -50,22 +61,23 @@ class Availability(models.Model):
     is_active = models.BooleanField(default=True)
     is_booked = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = AvailabilityQuerySet.as_manager()
 
     class Meta:
         ordering = ['start']
         verbose_name = 'Availability'
         verbose_name_plural = 'Availabilities'
+        indexes = [
+            models.Index(fields=['mentor', 'start']),
+            models.Index(fields=['mentor', 'is_active', 'is_booked']),
+            models.Index(fields=['mentor', 'is_active', 'start']),
+        ]
 
     def __str__(self):
         if self.start and self.end:
             return f"{self.mentor.get_full_name()} - {self.start.isoformat()} to {self.end.isoformat()}"
-        # legacy fallback if old fields exist
-        day = getattr(self, 'day_of_week', None)
-        st = getattr(self, 'start_time', None)
-        et = getattr(self, 'end_time', None)
-        if day is not None and st and et:
-            label = self.get_day_of_week_display() if hasattr(self, 'get_day_of_week_display') else str(day)
-            return f"{self.mentor.get_full_name()} - {label} {st}-{et}"
         return f"{self.mentor.get_full_name()} - availability"
 
     def clean(self):
@@ -74,12 +86,44 @@ class Availability(models.Model):
             raise ValidationError({'end': 'End must be after start.'})
 
     def overlaps(self, other_start, other_end):
-        """Return True if this availability overlaps with given datetimes."""
+        """Return True if this availability overlaps with given datetimes.
+
+        To check many slots at once use `Availability.objects.overlapping()`.
+        """
         if not (self.start and self.end):
             return False
         return not (other_end <= self.start or other_start >= self.end)
 
 
+class SessionQuerySet(models.QuerySet):
+    def set_status(self, status):
+        """Bulk status transition in a single UPDATE; returns rows changed"""
+        # update() sends no signals, so invalidate cached mentor reads here;
+        # collect mentors first since the update may change what matches
+        mentor_ids = list(self.values_list('mentor_id', flat=True).distinct())
+        changed = self.update(status=status, updated_at=timezone.now())
+        bump_mentor_cache(*mentor_ids)
+        return changed
+
+    def complete(self):
+        return self.set_status('completed')
+
+    def reject(self):
+        return self.set_status('rejected')
+
+    def cancel(self):
+        return self.set_status('cancelled')
+
+    def with_participants(self):
+        """Join mentor/student and load only what calendar/ICS output reads"""
+        return self.select_related('mentor', 'student').only(
+            'id', 'title', 'description', 'start', 'end', 'status', 'session_type',
+            'location_name', 'address', 'meeting_link',
+            'mentor__first_name', 'mentor__last_name',
+            'student__first_name', 'student__last_name',
+        )
+
+
 class Session(models.Model):
     """
     Booked mentorship session
@@ -158,18 +202,46 @@ class Session(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SessionQuerySet.as_manager()
+
     class Meta:
         ordering = ['-start']
         verbose_name = 'Session'
         verbose_name_plural = 'Sessions'
+        indexes = [
+            models.Index(fields=['mentor', 'start']),
+            models.Index(fields=['student', 'start']),
+            models.Index(fields=['status', 'start']),
+            models.Index(fields=['mentor', 'status', 'start']),
+        ]
 
     def __str__(self):
+        return self._display
+
+    @cached_property
+    def _display(self):
         return f"{self.title or 'Session'} - {self.mentor.get_full_name()} & {self.student.get_full_name()}"
 
+    @cached_property
+    def duration_minutes(self):
+        """Session length in whole minutes, or '' when start/end are missing"""
+        if not (self.start and self.end):
+            return ''
+        return (self.end - self.start) // timedelta(minutes=1)
+
+    def _set_status(self, status):
+        """Persist a status change, writing only status/updated_at"""
+        self.status = status
+        if self.pk is None:
+            self.save()
+            return
+        self.updated_at = timezone.now()
+        Session.objects.filter(pk=self.pk).update(status=status, updated_at=self.updated_at)
+        bump_mentor_cache(self.mentor_id)
+
     def complete(self):
         """Mark session as completed"""
-        self.status = 'completed'
-        self.save()
+        self._set_status('completed')
 
     def approve(self, by_user=None):
         """Approve the session; mark availability as booked and set approved status."""
@@ -178,17 +250,23 @@ class Session(models.Model):
         # prevent double booking: if availability already booked raise
         if self.availability and self.availability.is_booked:
             raise ValidationError('This availability is already booked')
-        self.status = 'approved'
-        self.save()
-        if self.availability:
-            self.availability.is_booked = True
-            self.availability.save()
+        # One transaction so the cache bump waits for both writes
+        with transaction.atomic():
+            if self.availability_id:
+                # Conditional UPDATE: of two concurrent approvals for the same
+                # slot, only one can flip is_booked; the other rolls back
+                claimed = Availability.objects.filter(pk=self.availability_id, is_booked=False).update(
+                    is_booked=True, updated_at=timezone.now()
+                )
+                if not claimed:
+                    raise ValidationError('This availability is already booked')
+                if self.availability:
+                    self.availability.is_booked = True
+            self._set_status('approved')
 
     def reject(self, reason=None):
-        self.status = 'rejected'
-        self.save()
+        self._set_status('rejected')
 
     def cancel(self):
         """Cancel the session"""
-        self.status = 'cancelled'
-        self.save()
+        self._set_status('cancelled')
@@ -0,0 +1,62 @@
+"""
+Paginators that avoid a full COUNT(*) on large session tables
+"""
+
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Use PostgreSQL's planner row estimate for unfiltered querysets.
+
+    Filtered querysets, other database backends and tables that have not
+    been analysed yet fall back to the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        query = getattr(qs, 'query', None)
+        if query is not None and not query.where:
+            connection = connections[qs.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                        [qs.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] > 0:
+                    return row[0]
+        return super().count
+
+
+class CachedCountPaginator(EstimatedCountPaginator):
+    """
+    Cache exact counts of filtered querysets for a short time.
+
+    The key is a hash of the compiled SQL and its parameters, so every
+    filter combination gets its own entry. Counts may lag behind writes
+    by up to `count_cache_timeout` seconds.
+    """
+
+    count_cache_timeout = 60
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or not query.where:
+            return super().count
+        sql, params = query.sql_with_params()
+        digest = hashlib.md5(repr((sql, params)).encode(), usedforsecurity=False).hexdigest()
+        key = f'paginator:count:{digest}'
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, self.count_cache_timeout)
+        return count
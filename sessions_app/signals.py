@@ -0,0 +1,16 @@
+"""
+Sessions App Signals
+Invalidate per-mentor cached reads when sessions or availability change
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import bump_mentor_cache
+from .models import Availability, Session
+
+
+@receiver([post_save, post_delete], sender=Session)
+@receiver([post_save, post_delete], sender=Availability)
+def invalidate_mentor_cache(sender, instance, **kwargs):
+    bump_mentor_cache(instance.mentor_id)
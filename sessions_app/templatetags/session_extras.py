@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django import template
 from django.utils import timezone
 
@@ -9,17 +11,17 @@ def duration_minutes(start, end):
     """Return duration between two datetimes in whole minutes.
 
     Usage: {{ start|duration_minutes:end }}
+    Prefer `Session.duration_minutes` when a Session instance is available.
     """
     if not start or not end:
         return ''
     try:
-        # Ensure datetimes are timezone-aware consistently
-        if timezone.is_naive(start):
-            start = timezone.make_aware(start)
-        if timezone.is_naive(end):
-            end = timezone.make_aware(end)
-        total_seconds = (end - start).total_seconds()
-        minutes = int(total_seconds // 60)
-        return minutes
+        # Only normalise when the two values disagree on awareness
+        if timezone.is_naive(start) != timezone.is_naive(end):
+            if timezone.is_naive(start):
+                start = timezone.make_aware(start)
+            else:
+                end = timezone.make_aware(end)
+        return (end - start) // timedelta(minutes=1)
     except Exception:
         return ''
@@ -21,8 +21,6 @@ urlpatterns = [
 
     # Availability (mentor)
     path('availability/', views.AvailabilityListView.as_view(), name='availability'),
-    # provide both name variants for compatibility
-    path('availability/add/', views.AddAvailabilityView.as_view(), name='add-availability'),
     path('availability/add/', views.AddAvailabilityView.as_view(), name='add_availability'),
     path('availability/<int:pk>/edit/', views.EditAvailabilityView.as_view(), name='edit_availability'),
     path('availability/<int:pk>/delete/', views.delete_availability, name='delete_availability'),
@@ -1,31 +1,38 @@
-from django.shortcuts import get_object_or_404, redirect, render
+"""
+Sessions App Views
+"""
+
+import json
+from itertools import groupby
+from operator import itemgetter
+
+from django.shortcuts import render, redirect, get_object_or_404
 from django.views import View
-from django.views.generic import CreateView, TemplateView, ListView
+from django.views.generic import ListView, DetailView, CreateView, TemplateView, UpdateView
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import JsonResponse, HttpResponseForbidden
-from django.urls import reverse_lazy
+from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from .models import Availability, Session
-from .forms import AvailabilityForm, SessionRequestForm
-from .forms import SessionCreateForm
-from django.contrib.auth import get_user_model
-User = get_user_model()
+from django.http import HttpResponse, HttpResponseForbidden
+from django.urls import reverse_lazy
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import BooleanField, CharField, Count, F, Max, Q, Value
+from django.db.models.functions import Concat, Trim, TruncDate
 from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to Django's JSON encoder
+    orjson = None
 
-
-class AddAvailabilityView(LoginRequiredMixin, CreateView):
-    model = Availability
-    form_class = AvailabilityForm
-    template_name = 'sessions_app/add_availability.html'
-    success_url = reverse_lazy('sessions_app:mentor-schedule')
-
-    def form_valid(self, form):
-        av = form.save(commit=False)
-        av.mentor = self.request.user
-        av.save()
-        messages.success(self.request, 'Availability added.')
-        return super().form_valid(form)
+from accounts.models import User
+from notifications.services import notify
+from .models import Session, Availability
+from .forms import AvailabilityForm, SessionCreateForm, SessionRequestForm, SessionRescheduleForm
+from .pagination import CachedCountPaginator
+from .caching import bump_mentor_cache, mentor_cache_key, mentor_cache_version
 
 
 class MentorScheduleView(LoginRequiredMixin, TemplateView):
@@ -40,110 +47,142 @@ class MentorScheduleView(LoginRequiredMixin, TemplateView):
         return ctx
 
 
+def _events_etag(request, mentor_id):
+    # Deletes don't move max(updated_at); the cache version catches them.
+    # No Last-Modified is sent, since a timestamp alone would 304 after a delete
+    session_max = Session.objects.filter(mentor_id=mentor_id).aggregate(ts=Max('updated_at'))['ts']
+    avail_max = Availability.objects.filter(mentor_id=mentor_id).aggregate(ts=Max('updated_at'))['ts']
+    last_modified = max(filter(None, (session_max, avail_max)), default=None)
+    stamp = last_modified.timestamp() if last_modified else 0
+    return f"{mentor_cache_version(mentor_id)}-{stamp}"
+
+
+@method_decorator(condition(etag_func=_events_etag), name='get')
 class EventsJsonView(View):
+    # Polled by FullCalendar; writes bump the mentor's cache version
+    cache_timeout = 300
+
     def get(self, request, mentor_id):
         mentor_id = int(mentor_id)
-        # Pull availabilities and sessions for the mentor
-        avail_qs = Availability.objects.filter(mentor_id=mentor_id, is_active=True)
-        sessions_qs = Session.objects.filter(mentor_id=mentor_id)
+        key = mentor_cache_key('mentor_events', mentor_id)
+        content = cache.get(key)
+        if content is None:
+            events = self.get_events(mentor_id)
+            if orjson is not None:
+                content = orjson.dumps(events)
+            else:
+                content = json.dumps(events, cls=DjangoJSONEncoder, separators=(',', ':')).encode()
+            cache.set(key, content, self.cache_timeout)
+        return HttpResponse(content, content_type='application/json')
+
+    def get_events(self, mentor_id):
+        # One UNION ALL over availabilities and sessions; both sides project
+        # the same columns, with `kind` telling the rows apart
+        columns = (
+            'id', 'start', 'end', 'location_name', 'address', 'session_type',
+            'kind', 'booked', 'event_title', 'event_status', 'student_name',
+        )
+        blank = Value('', output_field=CharField())
+        avail_rows = Availability.objects.filter(mentor_id=mentor_id, is_active=True).annotate(
+            kind=Value('a', output_field=CharField()),
+            booked=F('is_booked'),
+            event_title=blank,
+            event_status=blank,
+            student_name=blank,
+        ).values(*columns).order_by()
+        # Trim mirrors get_full_name() when either name part is blank
+        session_rows = Session.objects.filter(mentor_id=mentor_id).annotate(
+            kind=Value('s', output_field=CharField()),
+            booked=Value(False, output_field=BooleanField()),
+            event_title=F('title'),
+            event_status=F('status'),
+            student_name=Trim(Concat('student__first_name', Value(' '), 'student__last_name')),
+        ).values(*columns).order_by()
+        rows = avail_rows.union(session_rows, all=True).order_by('kind', 'start')
 
         events = []
-        for av in avail_qs:
-            if av.start and av.end:
+        # Datetimes are pre-formatted so orjson and the json fallback emit the
+        # same payload. Stream rows instead of filling the result cache
+        for row in rows.iterator(chunk_size=500):
+            if not (row['start'] and row['end']):
+                continue
+            if row['kind'] == 'a':
                 events.append({
-                    'id': f"avail-{av.id}",
-                    'title': f"Available - {av.location_name or 'Online'}",
-                    'start': av.start.isoformat(),
-                    'end': av.end.isoformat(),
+                    'id': f"avail-{row['id']}",
+                    'title': f"Available - {row['location_name'] or 'Online'}",
+                    'start': row['start'].isoformat(),
+                    'end': row['end'].isoformat(),
                     'color': 'green',
                     'extendedProps': {
                         'type': 'availability',
-                        'availability_id': av.id,
-                        'location_name': av.location_name,
-                        'address': av.address,
-                        'session_type': av.session_type,
-                        'is_booked': av.is_booked,
+                        'availability_id': row['id'],
+                        'location_name': row['location_name'],
+                        'address': row['address'],
+                        'session_type': row['session_type'],
+                        'is_booked': row['booked'],
                     }
                 })
-
-        for s in sessions_qs:
-            if s.start and s.end:
+            else:
                 events.append({
-                    'id': f"session-{s.id}",
-                    'title': f"{s.title or 'Booked'} - {s.location_name or s.session_type}",
-                    'start': s.start.isoformat(),
-                    'end': s.end.isoformat(),
-                    'color': 'blue' if s.status in ('approved', 'pending') else 'gray',
+                    'id': f"session-{row['id']}",
+                    'title': f"{row['event_title'] or 'Booked'} - {row['location_name'] or row['session_type']}",
+                    'start': row['start'].isoformat(),
+                    'end': row['end'].isoformat(),
+                    'color': 'blue' if row['event_status'] in ('approved', 'pending') else 'gray',
                     'extendedProps': {
                         'type': 'session',
-                        'session_id': s.id,
-                        'status': s.status,
-                        'student': s.student.get_full_name(),
-                        'location_name': s.location_name,
-                        'address': s.address,
+                        'session_id': row['id'],
+                        'status': row['event_status'],
+                        'student': row['student_name'],
+                        'location_name': row['location_name'],
+                        'address': row['address'],
                     }
                 })
 
-        return JsonResponse(events, safe=False)
+        return events
 
 
 class BookAvailabilityView(LoginRequiredMixin, View):
     def post(self, request, availability_id):
-        av = get_object_or_404(Availability, id=availability_id, is_active=True)
-        # prevent booking if already booked
-        if av.is_booked:
-            messages.error(request, 'This slot is already booked.')
+        form = SessionRequestForm(request.POST)
+        if not form.is_valid():
+            messages.error(request, 'Invalid request.')
             return redirect(request.META.get('HTTP_REFERER', '/'))
 
-        form = SessionRequestForm(request.POST)
-        if form.is_valid():
-            s = form.save(commit=False)
-            s.student = request.user
-            s.mentor = av.mentor
-            s.availability = av
-            s.start = av.start
-            s.end = av.end
-            s.session_type = av.session_type or 'online'
-            s.location_name = av.location_name
-            s.address = av.address
-            s.status = 'pending'
-            s.save()
-            # Notify mentor
-            try:
-                from notifications.models import Notification
-                Notification.objects.create(
-                    recipient=av.mentor,
-                    sender=request.user,
-                    notification_type='session_requested',
-                    message=f'{request.user.get_full_name()} requested a session with you.'
-                )
-            except Exception:
-                pass
-            messages.success(request, 'Session request sent to mentor.')
-            return redirect('sessions_app:student-schedule')
-        messages.error(request, 'Invalid request.')
-        return redirect(request.META.get('HTTP_REFERER', '/'))
+        # A request only creates a pending session; the slot is claimed when
+        # the mentor approves (see Session.approve). Booked slots aren't found
+        av = get_object_or_404(
+            Availability.objects.select_related('mentor'),
+            id=availability_id, is_active=True, is_booked=False,
+        )
+        s = form.save(commit=False)
+        s.student = request.user
+        s.mentor = av.mentor
+        s.availability = av
+        s.start = av.start
+        s.end = av.end
+        s.session_type = av.session_type or 'online'
+        s.location_name = av.location_name
+        s.address = av.address
+        s.status = 'pending'
+        s.save()
+        # Notify mentor
+        notify(request, av.mentor, 'session_requested', f'{request.user.get_full_name()} requested a session with you.')
+        messages.success(request, 'Session request sent to mentor.')
+        return redirect('sessions_app:student-schedule')
 
 
 class ApproveSessionView(LoginRequiredMixin, View):
     def post(self, request, session_id):
-        s = get_object_or_404(Session, id=session_id)
-        if request.user != s.mentor:
-            return HttpResponseForbidden()
+        s = get_object_or_404(
+            Session.objects.select_related('student', 'mentor', 'availability'),
+            id=session_id, mentor=request.user,
+        )
         try:
             s.approve(by_user=request.user)
             messages.success(request, 'Session approved — slot marked as booked.')
             # Notify student
-            try:
-                from notifications.models import Notification
-                Notification.objects.create(
-                    recipient=s.student,
-                    sender=request.user,
-                    notification_type='session_approved',
-                    message=f'Your session "{s.title}" has been approved by {request.user.get_full_name()}.'
-                )
-            except Exception:
-                pass
+            notify(request, s.student, 'session_approved', f'Your session "{s.title}" has been approved by {request.user.get_full_name()}.')
         except Exception as e:
             messages.error(request, str(e))
         return redirect(request.META.get('HTTP_REFERER', '/'))
@@ -151,109 +190,100 @@ class ApproveSessionView(LoginRequiredMixin, View):
 
 class RejectSessionView(LoginRequiredMixin, View):
     def post(self, request, session_id):
-        s = get_object_or_404(Session, id=session_id)
-        if request.user != s.mentor:
-            return HttpResponseForbidden()
+        s = get_object_or_404(
+            Session.objects.select_related('student', 'mentor', 'availability'),
+            id=session_id, mentor=request.user,
+        )
         s.reject()
         messages.success(request, 'Session rejected.')
         # Notify student
-        try:
-            from notifications.models import Notification
-            Notification.objects.create(
-                recipient=s.student,
-                sender=request.user,
-                notification_type='session_rejected',
-                message=f'Your session "{s.title}" has been rejected by {request.user.get_full_name()}.'
-            )
-        except Exception:
-            pass
+        notify(request, s.student, 'session_rejected', f'Your session "{s.title}" has been rejected by {request.user.get_full_name()}.')
         return redirect(request.META.get('HTTP_REFERER', '/'))
 
 
 class StartSessionView(LoginRequiredMixin, View):
     def post(self, request, session_id):
-        s = get_object_or_404(Session, id=session_id)
-        if request.user != s.mentor:
-            return HttpResponseForbidden()
-        # Only allow starting for physical sessions
-        if s.session_type != 'physical':
-            messages.error(request, 'Only in-person sessions can be started this way.')
-            return redirect(request.META.get('HTTP_REFERER', '/'))
-        if s.status != 'approved':
-            messages.error(request, 'Session must be approved to start.')
+        sessions = Session.objects.filter(id=session_id, mentor=request.user)
+        # Conditional UPDATE: the status check and the write happen atomically
+        updated = sessions.filter(status='approved', session_type='physical').update(
+            status='in_progress', updated_at=timezone.now()
+        )
+        if not updated:
+            s = get_object_or_404(sessions)
+            # Only allow starting for physical sessions
+            if s.session_type != 'physical':
+                messages.error(request, 'Only in-person sessions can be started this way.')
+            else:
+                messages.error(request, 'Session must be approved to start.')
             return redirect(request.META.get('HTTP_REFERER', '/'))
-        s.status = 'in_progress'
-        s.save()
+        bump_mentor_cache(request.user.pk)
+        student_id, title = sessions.values_list('student_id', 'title').get()
         messages.success(request, 'Session marked as in progress.')
         # Notify student
-        try:
-            from notifications.models import Notification
-            Notification.objects.create(
-                recipient=s.student,
-                sender=request.user,
-                notification_type='session_started',
-                message=f'Session "{s.title}" has started.'
-            )
-        except Exception:
-            pass
+        notify(request, student_id, 'session_started', f'Session "{title}" has started.')
         return redirect(request.META.get('HTTP_REFERER', '/'))
 
 
 class CompleteSessionView(LoginRequiredMixin, View):
     def post(self, request, session_id):
-        s = get_object_or_404(Session, id=session_id)
-        if request.user != s.mentor:
-            return HttpResponseForbidden()
-        if s.session_type != 'physical':
-            messages.error(request, 'Only in-person sessions can be completed this way.')
-            return redirect(request.META.get('HTTP_REFERER', '/'))
-        if s.status not in ('approved', 'in_progress'):
-            messages.error(request, 'Session must be approved or in progress to complete.')
+        sessions = Session.objects.filter(id=session_id, mentor=request.user)
+        updated = sessions.filter(status__in=['approved', 'in_progress'], session_type='physical').update(
+            status='completed', updated_at=timezone.now()
+        )
+        if not updated:
+            s = get_object_or_404(sessions)
+            if s.session_type != 'physical':
+                messages.error(request, 'Only in-person sessions can be completed this way.')
+            else:
+                messages.error(request, 'Session must be approved or in progress to complete.')
             return redirect(request.META.get('HTTP_REFERER', '/'))
-        s.status = 'completed'
-        s.save()
         # mark availability booked if present
-        if s.availability:
-            s.availability.is_booked = True
-            s.availability.save()
+        Availability.objects.filter(booked_sessions__id=session_id).update(is_booked=True, updated_at=timezone.now())
+        bump_mentor_cache(request.user.pk)
+        student_id, title = sessions.values_list('student_id', 'title').get()
         messages.success(request, 'Session marked as completed.')
         # Notify student
-        try:
-            from notifications.models import Notification
-            Notification.objects.create(
-                recipient=s.student,
-                sender=request.user,
-                notification_type='session_completed',
-                message=f'Session "{s.title}" has been completed.'
-            )
-        except Exception:
-            pass
+        notify(request, student_id, 'session_completed', f'Session "{title}" has been completed.')
         return redirect(request.META.get('HTTP_REFERER', '/'))
 
 
-class StudentScheduleView(LoginRequiredMixin, TemplateView):
+class StudentScheduleView(LoginRequiredMixin, ListView):
     template_name = 'sessions_app/student_schedule.html'
+    context_object_name = 'sessions'
+    paginate_by = 25
+
+    def get_queryset(self):
+        return Session.objects.filter(student=self.request.user).select_related('mentor').order_by('-start')
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        sessions = Session.objects.filter(student=self.request.user).order_by('-start')
-        ctx['sessions'] = sessions
-        ctx['total_count'] = sessions.count()
-        ctx['approved_count'] = sessions.filter(status='approved').count()
-        ctx['pending_count'] = sessions.filter(status='pending').count()
-        ctx['rejected_count'] = sessions.filter(status='rejected').count()
-        ctx['completed_count'] = sessions.filter(status='completed').count()
-        ctx['in_progress_count'] = sessions.filter(status='in_progress').count()
+        # The paginator has already counted every row; the per-status
+        # counters come from one aggregate query
+        ctx['total_count'] = ctx['paginator'].count
+        ctx.update(self.object_list.aggregate(
+            approved_count=Count('id', filter=Q(status='approved')),
+            pending_count=Count('id', filter=Q(status='pending')),
+            rejected_count=Count('id', filter=Q(status='rejected')),
+            completed_count=Count('id', filter=Q(status='completed')),
+            in_progress_count=Count('id', filter=Q(status='in_progress')),
+        ))
         return ctx
 
 
-class MentorSessionsListView(LoginRequiredMixin, TemplateView):
+class MentorSessionsListView(LoginRequiredMixin, ListView):
     template_name = 'sessions_app/mentor_sessions.html'
+    context_object_name = 'sessions'
+    paginate_by = 25
 
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx['sessions'] = Session.objects.filter(mentor=self.request.user).order_by('-start')
-        return ctx
+    def get_queryset(self):
+        return Session.objects.filter(mentor=self.request.user).select_related('student').order_by('-start')
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+        # Each page is served from cache until one of this mentor's sessions changes
+        key = mentor_cache_key('mentor_sessions', self.request.user.pk, page.number)
+        page.object_list = cache.get_or_set(key, lambda: list(object_list), 60)
+        return paginator, page, page.object_list, is_paginated
 
 
 class MentorCreateSessionView(LoginRequiredMixin, View):
@@ -278,37 +308,10 @@ class MentorCreateSessionView(LoginRequiredMixin, View):
             s.status = 'approved'
             s.save()
             # Notify student
-            try:
-                from notifications.models import Notification
-                Notification.objects.create(
-                    recipient=s.student,
-                    sender=request.user,
-                    notification_type='session_created',
-                    message=f'{request.user.get_full_name()} created a session with you.'
-                )
-            except Exception:
-                pass
+            notify(request, s.student, 'session_created', f'{request.user.get_full_name()} created a session with you.')
             messages.success(request, 'Session created.')
             return redirect('sessions_app:mentor-sessions')
         return render(request, self.template_name, {'form': form})
-"""
-Sessions App Views
-"""
-
-from django.shortcuts import render, redirect, get_object_or_404
-from django.views.generic import ListView, DetailView, CreateView, TemplateView, UpdateView
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.contrib.auth.decorators import login_required
-from django.contrib import messages
-from django.http import JsonResponse
-from django.urls import reverse_lazy
-from django.db.models import Q
-from django.utils import timezone
-
-
-from accounts.models import User
-from .models import Session, Availability
-from .forms import SessionRescheduleForm
 
 
 class SessionListView(LoginRequiredMixin, ListView):
@@ -316,6 +319,7 @@ class SessionListView(LoginRequiredMixin, ListView):
     template_name = 'sessions_app/list.html'
     context_object_name = 'sessions'
     paginate_by = 10
+    paginator_class = CachedCountPaginator
 
     def get_queryset(self):
         user = self.request.user
@@ -390,16 +394,7 @@ class BookSessionView(LoginRequiredMixin, CreateView):
         response = super().form_valid(form)
         
         # Notify mentor
-        try:
-            from notifications.models import Notification
-            Notification.objects.create(
-                recipient=self.mentor,
-                sender=self.request.user,
-                notification_type='session_booked',
-                message=f'{self.request.user.get_full_name()} booked a session with you.'
-            )
-        except Exception:
-            pass
+        notify(self.request, self.mentor, 'session_booked', f'{self.request.user.get_full_name()} booked a session with you.')
         
         messages.success(self.request, 'Session booked successfully!')
         return response
@@ -408,25 +403,17 @@ class BookSessionView(LoginRequiredMixin, CreateView):
 @login_required
 def cancel_session(request, pk):
     """Cancel a session"""
-    session = get_object_or_404(Session, pk=pk)
-    if session.mentor != request.user and session.student != request.user:
-        messages.error(request, 'You cannot cancel this session.')
-        return redirect('sessions_app:list')
-    
+    session = get_object_or_404(
+        Session.objects.select_related('student', 'mentor'),
+        Q(mentor=request.user) | Q(student=request.user),
+        pk=pk,
+    )
+
     session.cancel()
     
     # Notify the other party
     recipient = session.student if request.user == session.mentor else session.mentor
-    try:
-        from notifications.models import Notification
-        Notification.objects.create(
-            recipient=recipient,
-            sender=request.user,
-            notification_type='session_cancelled',
-            message=f'Session "{session.title}" has been cancelled.'
-        )
-    except Exception:
-        pass
+    notify(request, recipient, 'session_cancelled', f'Session "{session.title}" has been cancelled.')
     
     messages.info(request, 'Session cancelled.')
     return redirect('sessions_app:list')
@@ -450,16 +437,7 @@ class RescheduleSessionView(LoginRequiredMixin, UpdateView):
         session.save()
         # Notify the other party
         recipient = session.student if self.request.user == session.mentor else session.mentor
-        try:
-            from notifications.models import Notification
-            Notification.objects.create(
-                recipient=recipient,
-                sender=self.request.user,
-                notification_type='session_rescheduled',
-                message=f'Session "{session.title}" has been rescheduled.'
-            )
-        except Exception:
-            pass
+        notify(self.request, recipient, 'session_rescheduled', f'Session "{session.title}" has been rescheduled.')
         messages.success(self.request, 'Session rescheduled successfully!')
         return super().form_valid(form)
 
@@ -476,9 +454,8 @@ def complete_session(request, pk):
 @login_required
 def session_ics_export(request, pk):
     """Export session to ICS calendar file"""
-    session = get_object_or_404(Session, pk=pk)
-    if session.mentor != request.user and session.student != request.user:
-        from django.http import HttpResponseForbidden
+    session = get_object_or_404(Session.objects.with_participants(), pk=pk)
+    if session.mentor_id != request.user.pk and session.student_id != request.user.pk:
         return HttpResponseForbidden()
     from .calendar_utils import session_ics_response
     filename = f'session-{session.pk}.ics'
@@ -532,17 +509,22 @@ def delete_availability(request, pk):
     return redirect('sessions_app:availability')
 
 
-class MentorCalendarView(TemplateView):
+class MentorCalendarView(LoginRequiredMixin, TemplateView):
     """View mentor's calendar/availability (month grid) - reuses mentorship template."""
     template_name = 'mentorship/mentor_calendar.html'
+    # How many years either side of the current one can be browsed
+    year_span = 10
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         mentor = get_object_or_404(User, pk=kwargs['mentor_id'], role='mentor')
 
         # month/year from query params or current
-        year = int(self.request.GET.get('year', timezone.now().year))
-        month = int(self.request.GET.get('month', timezone.now().month))
+        # Clamped so arbitrary query strings can't mint unbounded cache keys
+        this_year = timezone.now().year
+        year = int(self.request.GET.get('year', this_year))
+        year = min(max(year, this_year - self.year_span), this_year + self.year_span)
+        month = min(max(int(self.request.GET.get('month', timezone.now().month)), 1), 12)
 
         import calendar as _calendar
         from datetime import datetime, date
@@ -557,31 +539,14 @@ class MentorCalendarView(TemplateView):
         else:
             end_date = date(year, month + 1, 1)
 
-        # Query availabilities whose start date is within month
-        avail_qs = Availability.objects.filter(
-            mentor=mentor,
-            start__date__gte=start_date,
-            start__date__lt=end_date,
-            is_active=True,
-        ).order_by('start')
-
-        availability_by_date = {}
-        for av in avail_qs:
-            d = av.start.date()
-            key = d.isoformat()
-            slot = {
-                'id': av.id,
-                'date': d,
-                'start_time': av.start.time(),
-                'end_time': av.end.time() if av.end else None,
-                'title': av.title if hasattr(av, 'title') and av.title else 'Available',
-                'description': getattr(av, 'description', ''),
-                'is_available': not av.is_booked,
-                'spots_left': getattr(av, 'spots_left', 1),
-                'max_bookings': getattr(av, 'max_bookings', 1),
-                'current_bookings': getattr(av, 'current_bookings', 0),
-            }
-            availability_by_date.setdefault(key, []).append(slot)
+        # Month data only changes when the mentor's availability does; past
+        # months live longer but still expire, since a version bump orphans
+        # their keys
+        cache_key = mentor_cache_key('mentor_calendar', mentor.pk, year, month)
+        timeout = 86400 if end_date <= timezone.now().date() else 3600
+        availability_by_date = cache.get_or_set(
+            cache_key, lambda: self.get_availability_by_date(mentor, start_date, end_date), timeout
+        )
 
         # navigation months
         prev_month = month - 1 if month > 1 else 12
@@ -605,11 +570,48 @@ class MentorCalendarView(TemplateView):
         })
 
         # upcoming booked sessions for the mentor
-        if self.request.user.is_authenticated:
-            context['booked_sessions'] = Session.objects.filter(
-                mentor=mentor,
-                status__in=['approved', 'pending', 'in_progress'],
-                start__gte=timezone.now()
-            ).order_by('start')
+        context['booked_sessions'] = Session.objects.filter(
+            mentor=mentor,
+            status__in=['approved', 'pending', 'in_progress'],
+            start__gte=timezone.now()
+        ).select_related('student').order_by('start')
 
         return context
+
+    def get_availability_by_date(self, mentor, start_date, end_date):
+        """Group the mentor's active slots in [start_date, end_date) by ISO date"""
+        from datetime import datetime, time
+
+        # Plain range on start (no DATE() per row) so the
+        # (mentor, is_active, start) index applies
+        start_dt = timezone.make_aware(datetime.combine(start_date, time.min))
+        end_dt = timezone.make_aware(datetime.combine(end_date, time.min))
+        # Let the database bucket and sort rows by local day, then group the
+        # ordered stream in one pass
+        rows = Availability.objects.filter(
+            mentor=mentor,
+            start__gte=start_dt,
+            start__lt=end_dt,
+            is_active=True,
+        ).annotate(day=TruncDate('start')).values('id', 'day', 'start', 'end', 'is_booked').order_by('day', 'start')
+
+        # Availability has no title/description/capacity columns; the
+        # template still expects them, so fill in single-booking defaults
+        return {
+            day.isoformat(): [
+                {
+                    'id': r['id'],
+                    'date': day,
+                    'start_time': timezone.localtime(r['start']).time(),
+                    'end_time': timezone.localtime(r['end']).time() if r['end'] else None,
+                    'title': 'Available',
+                    'description': '',
+                    'is_available': not r['is_booked'],
+                    'spots_left': 1,
+                    'max_bookings': 1,
+                    'current_bookings': 0,
+                }
+                for r in group
+            ]
+            for day, group in groupby(rows.iterator(chunk_size=500), key=itemgetter('day'))
+        }
@@ -1,89 +1,148 @@
 #!/usr/bin/env python
 import os
+import sys
+
 import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
+from django.db import transaction
+
 from accounts.forms import StudentRegistrationForm, MentorRegistrationForm
 from accounts.models import User
+from profiles.models import MentorProfile
 
-print("=" * 60)
-print("Testing StudentRegistrationForm")
-print("=" * 60)
 
-# Test 1: Create a StudentRegistrationForm
-try:
-    student_form = StudentRegistrationForm()
-    print("✓ StudentRegistrationForm instantiated successfully")
-    print(f"  Fields: {list(student_form.fields.keys())}")
-except Exception as e:
-    print(f"✗ Error instantiating StudentRegistrationForm: {e}")
-
-# Test 2: Validate with valid data
-print("\nTesting with valid student data...")
-student_data = {
-    'email': 'student@test.com',
-    'first_name': 'John',
-    'last_name': 'Doe',
-    'password1': 'TestPassword123!',
-    'password2': 'TestPassword123!',
-    'agree_terms': True
-}
-try:
-    student_form = StudentRegistrationForm(data=student_data)
-    if student_form.is_valid():
-        print("✓ StudentRegistrationForm is valid")
-        user = student_form.save()
-        print(f"✓ Student user created: {user.email} (role: {user.role})")
-    else:
-        print(f"✗ StudentRegistrationForm validation failed:")
-        for field, errors in student_form.errors.items():
-            print(f"  {field}: {errors}")
-except Exception as e:
-    print(f"✗ Error with StudentRegistrationForm: {e}")
-
-print("\n" + "=" * 60)
-print("Testing MentorRegistrationForm")
-print("=" * 60)
-
-# Test 3: Create a MentorRegistrationForm
-try:
-    mentor_form = MentorRegistrationForm()
-    print("✓ MentorRegistrationForm instantiated successfully")
-    print(f"  Fields: {list(mentor_form.fields.keys())}")
-except Exception as e:
-    print(f"✗ Error instantiating MentorRegistrationForm: {e}")
-
-# Test 4: Validate with valid data
-print("\nTesting with valid mentor data...")
-mentor_data = {
-    'email': 'mentor@test.com',
-    'first_name': 'Jane',
-    'last_name': 'Smith',
-    'phone': '+1234567890',
-    'expertise': 'Software Engineering',
-    'experience_years': 5,
-    'password1': 'TestPassword123!',
-    'password2': 'TestPassword123!',
-    'agree_terms': True
-}
+def bulk_validate(data_list):
+    """Drop payloads whose email is taken, checking the whole batch in one query"""
+    existing = set(
+        User.objects.filter(email__in=[data['email'] for data in data_list]).values_list('email', flat=True)
+    )
+    passed = []
+    for data in data_list:
+        if data['email'] in existing:
+            print(f"✗ Skipping {data['email']}: an account with this email already exists")
+        else:
+            # Also catches duplicates within the batch itself
+            existing.add(data['email'])
+            passed.append(data)
+    return passed
+
+
+def create_users_bulk(form_cls, data_list):
+    """Validate each payload with form_cls and insert the valid users in batches"""
+    class PrescreenedForm(form_cls):
+        def clean_email(self):
+            # bulk_validate already checked uniqueness for the whole batch;
+            # skip the per-form exists() query
+            return self.cleaned_data.get('email')
+
+    forms = [PrescreenedForm(data=data) for data in bulk_validate(data_list)]
+    valid = []
+    for form in forms:
+        if form.is_valid():
+            valid.append(form)
+        else:
+            print(f"✗ {form_cls.__name__} validation failed:")
+            for field, errors in form.errors.items():
+                print(f"  {field}: {errors}")
+
+    # save(commit=False) hashes the password and sets the role without an INSERT
+    new_users = [form.save(commit=False) for form in valid]
+
+    # Users and their profiles succeed or roll back together
+    with transaction.atomic():
+        users = User.objects.bulk_create(new_users, batch_size=500)
+
+        # bulk_create skips MentorRegistrationForm.save(), so add the profiles here
+        if issubclass(form_cls, MentorRegistrationForm):
+            MentorProfile.objects.bulk_create([
+                MentorProfile(user=user, **form.profile_defaults())
+                for user, form in zip(users, valid)
+            ], batch_size=500)
+    return users
+
+
+# Users inserted by this run; only these are removed at the end, so
+# pre-existing accounts with the same emails are left alone
+created_users = []
+
 try:
-    mentor_form = MentorRegistrationForm(data=mentor_data)
-    if mentor_form.is_valid():
-        print("✓ MentorRegistrationForm is valid")
-        user = mentor_form.save()
-        print(f"✓ Mentor user created: {user.email} (role: {user.role})")
-    else:
-        print(f"✗ MentorRegistrationForm validation failed:")
-        for field, errors in mentor_form.errors.items():
-            print(f"  {field}: {errors}")
-except Exception as e:
-    print(f"✗ Error with MentorRegistrationForm: {e}")
-
-print("\n" + "=" * 60)
-print("Summary")
-print("=" * 60)
-print(f"Total users in database: {User.objects.count()}")
-for user in User.objects.all():
-    print(f"  - {user.email} (role: {user.role})")
+    # The whole flow commits once; create_users_bulk's inner atomic() is a
+    # savepoint, so a caught error there doesn't poison the transaction
+    with transaction.atomic():
+        print("=" * 60)
+        print("Testing StudentRegistrationForm")
+        print("=" * 60)
+
+        # Test 1: Create a StudentRegistrationForm
+        try:
+            student_form = StudentRegistrationForm()
+            print("✓ StudentRegistrationForm instantiated successfully")
+            print(f"  Fields: {list(student_form.fields.keys())}")
+        except Exception as e:
+            print(f"✗ Error instantiating StudentRegistrationForm: {e}")
+
+        # Test 2: Validate with valid data
+        print("\nTesting with valid student data...")
+        student_data = {
+            'email': 'student@test.com',
+            'first_name': 'John',
+            'last_name': 'Doe',
+            'password1': 'TestPassword123!',
+            'password2': 'TestPassword123!',
+            'terms': True
+        }
+        try:
+            users = create_users_bulk(StudentRegistrationForm, [student_data])
+            created_users.extend(users)
+            for user in users:
+                print(f"✓ Student user created: {user.email} (role: {user.role})")
+        except Exception as e:
+            print(f"✗ Error with StudentRegistrationForm: {e}")
+
+        print("\n" + "=" * 60)
+        print("Testing MentorRegistrationForm")
+        print("=" * 60)
+
+        # Test 3: Create a MentorRegistrationForm
+        try:
+            mentor_form = MentorRegistrationForm()
+            print("✓ MentorRegistrationForm instantiated successfully")
+            print(f"  Fields: {list(mentor_form.fields.keys())}")
+        except Exception as e:
+            print(f"✗ Error instantiating MentorRegistrationForm: {e}")
+
+        # Test 4: Validate with valid data
+        print("\nTesting with valid mentor data...")
+        mentor_data = {
+            'email': 'mentor@test.com',
+            'first_name': 'Jane',
+            'last_name': 'Smith',
+            'phone': '+1234567890',
+            'expertise': 'Software Engineering',
+            'experience_years': 5,
+            'city': 'Kigali',
+            'password1': 'TestPassword123!',
+            'password2': 'TestPassword123!',
+            'terms': True
+        }
+        try:
+            users = create_users_bulk(MentorRegistrationForm, [mentor_data])
+            created_users.extend(users)
+            for user in users:
+                print(f"✓ Mentor user created: {user.email} (role: {user.role})")
+                print(f"  Profile city: {user.mentor_profile.city}")
+        except Exception as e:
+            print(f"✗ Error with MentorRegistrationForm: {e}")
+
+        print("\n" + "=" * 60)
+        print("Summary")
+        print("=" * 60)
+        print(f"Total users in database: {User.objects.count()}")
+        rows = User.objects.values_list('email', 'role')
+        sys.stdout.write(''.join(f"  - {email} (role: {role})\n" for email, role in rows))
+finally:
+    # One DELETE ... WHERE id IN (...) rather than a per-user loop
+    User.objects.filter(pk__in=[user.pk for user in created_users]).delete()